@@ -31,12 +31,16 @@ any image in the camera memory that have not yet been read.
 
 Modifying the following settings require acquisition to be stopped:
 
-- ROIs
+- ROIs (but see below for changes of ROI offsets only)
 - binning
 - trigger type (trigger source)
 
 For more details, see the [XiAPI manual](https://www.ximea.com/support/wiki/apis/XiAPI_Manual#Flushing-the-queue).
 
+When only the ROI offsets change, they are first set without stopping
+acquisition.  If the camera rejects that, acquisition is stopped and
+restarted as for other ROI changes.
+
 Hardware trigger
 ----------------
 
@@ -56,9 +60,9 @@ PyPI.  See Ximea's website for `install instructions
 
 """
 
-import contextlib
 import enum
 import logging
+import types
 import typing
 
 import numpy as np
@@ -75,55 +79,77 @@ _logger = logging.getLogger(__name__)
 # There is ximea.xidefs.ERROR_CODES which maps the error code to an
 # error message but what we need is a symbol that maps to the error
 # code so we can use while handling exceptions.
-_XI_TIMEOUT = 10
-_XI_INVALID_ARGUMENTS = 11
-_XI_NOT_SUPPORTED = 12
-_XI_NOT_IMPLEMENTED = 26
-_XI_ACQUISITION_STOPED = 45
-_XI_UNKNOWN_PARAM = 100
+_XI_TIMEOUT: typing.Final[int] = 10
+_XI_INVALID_ARGUMENTS: typing.Final[int] = 11
+_XI_NOT_SUPPORTED: typing.Final[int] = 12
+_XI_NOT_IMPLEMENTED: typing.Final[int] = 26
+_XI_ACQUISITION_STOPED: typing.Final[int] = 45
+_XI_UNKNOWN_PARAM: typing.Final[int] = 100
+
 
+# XiAPI parameters for the temperature sensors a camera may have.
+_TEMP_PARAM_NAMES = (
+    "chip_temp",
+    "hous_temp",
+    "hous_back_side_temp",
+    "sensor_board_temp",
+)
 
-# During acquisition, we rely on catching timeout errors which then
-# get discarded.  However, with debug level set to warning (XiApi
-# default log level), we get XiApi messages on stderr for each timeout
-# making logging impossible.  So change this to error.
-#
-# Debug level is a xiapi global setting but we need a Camera instance.
-xiapi.Camera().set_debug_level("XI_DL_ERROR")
+# Temperature sensors found on each camera model.  Probing for a
+# sensor raises an error if it is not there, so only do it once per
+# model.
+_TEMP_SENSORS_BY_MODEL: typing.Dict[str, typing.Tuple[str, ...]] = {}
 
 
-@contextlib.contextmanager
-def _disabled_camera(camera):
+class _DisabledCamera:
     """Context manager to temporarily disable camera."""
-    if camera.enabled:
-        try:
-            camera.disable()
-            yield camera
-        finally:
-            camera.enable()
-    else:
-        yield camera
-
-
-@contextlib.contextmanager
-def _enabled_camera(camera):
-    """Context manager to temporarily enable camera."""
-    if not camera.enabled:
-        try:
-            camera.enable()
-            yield camera
-        finally:
-            camera.disable()
-    else:
-        yield camera
 
+    __slots__ = ("_camera", "_was_enabled")
 
-TRIGGER_TABLE: dict[tuple[microscope.TriggerType, microscope.TriggerMode], tuple[str, str]] = {
-    (microscope.TriggerType.SOFTWARE, microscope.TriggerMode.STROBE): ("XI_TRG_OFF", "XI_TRG_SEL_FRAME_START"),
-    (microscope.TriggerType.SOFTWARE, microscope.TriggerMode.ONCE): ("XI_TRG_SOFTWARE", "XI_TRG_SEL_FRAME_START"),
-    (microscope.TriggerType.RISING_EDGE, microscope.TriggerMode.ONCE): ("XI_TRG_EDGE_RISING", "XI_TRG_SEL_FRAME_START"),
-    (microscope.TriggerType.RISING_EDGE, microscope.TriggerMode.ONCE): ("XI_TRG_EDGE_RISING", "XI_TRG_SEL_FRAME_START")
-}
+    def __init__(self, camera) -> None:
+        self._camera = camera
+        self._was_enabled = camera.enabled
+
+    def __enter__(self):
+        if self._was_enabled:
+            try:
+                self._camera.disable()
+            except BaseException:
+                self._camera.enable()
+                raise
+        return self._camera
+
+    def __exit__(self, *exc_info) -> None:
+        if self._was_enabled:
+            self._camera.enable()
+
+
+# Map of microscope trigger type and mode to XiAPI trigger source and
+# selector.  It is read-only so that the values can be compared by
+# identity.
+TRIGGER_TABLE: typing.Mapping[
+    typing.Tuple[microscope.TriggerType, microscope.TriggerMode],
+    typing.Tuple[str, str],
+] = types.MappingProxyType(
+    {
+        (microscope.TriggerType.SOFTWARE, microscope.TriggerMode.STROBE): (
+            "XI_TRG_OFF",
+            "XI_TRG_SEL_FRAME_START",
+        ),
+        (microscope.TriggerType.SOFTWARE, microscope.TriggerMode.ONCE): (
+            "XI_TRG_SOFTWARE",
+            "XI_TRG_SEL_FRAME_START",
+        ),
+        (microscope.TriggerType.RISING_EDGE, microscope.TriggerMode.ONCE): (
+            "XI_TRG_EDGE_RISING",
+            "XI_TRG_SEL_FRAME_START",
+        ),
+    }
+)
+
+_SW_ONCE_MAP = TRIGGER_TABLE[
+    (microscope.TriggerType.SOFTWARE, microscope.TriggerMode.ONCE)
+]
 
 
 class XimeaCamera(microscope.abc.Camera):
@@ -133,22 +159,45 @@ class XimeaCamera(microscope.abc.Camera):
         serial_number: the serial number of the camera to connect to.
             It can be set to `None` if there is only camera on the
             system.
+        buffers_queue_size: number of image buffers in the XiAPI
+            queue.  XiAPI keeps acquiring images into these buffers
+            while the previous image is being processed.  If `None`,
+            the XiAPI default is kept.
 
     """
 
+    # Check, on each ROI query, that the cached ROI matches the camera
+    # setting.  This is a debugging aid since it queries the camera
+    # four times.
+    _verify_roi: bool = False
+
     def __init__(
-        self, serial_number: typing.Optional[str] = None, **kwargs
+        self,
+        serial_number: typing.Optional[str] = None,
+        buffers_queue_size: typing.Optional[int] = None,
+        **kwargs,
     ) -> None:
         super().__init__(**kwargs)
         self._acquiring = False
         self._handle = xiapi.Camera()
+        # During acquisition, we rely on catching timeout errors which
+        # then get discarded.  However, with debug level set to
+        # warning (XiApi default log level), we get XiApi messages on
+        # stderr for each timeout making logging impossible.  So
+        # change this to error.  Debug level is a xiapi global
+        # setting but we need a Camera instance, so set it here
+        # instead of creating a throwaway one at import time.
+        self._handle.set_debug_level("XI_DL_ERROR")
         self._img = xiapi.Image()
         self._serial_number = serial_number
+        self._buffers_queue_size = buffers_queue_size
         self._sensor_shape = (0, 0)
         self._roi = microscope.ROI(None, None, None, None)
+        # Height, width, offset X, and offset Y increments.
+        self._roi_incr = (1, 1, 1, 1)
         self._binning = microscope.Binning(1, 1)
-        self._trigger_map = TRIGGER_TABLE[(
-            microscope.TriggerType.SOFTWARE, microscope.TriggerMode.ONCE)]
+        self._trigger_map = _SW_ONCE_MAP
+        self._is_sw_once = True
 
         self.initialize()
 
@@ -157,26 +206,33 @@ class XimeaCamera(microscope.abc.Camera):
             return None
 
         try:
-            self._handle.get_image(self._img, timeout=1)
+            self._get_image(self._img, timeout=1)
         except xiapi.Xi_error as err:
-            # err.status may not exist so use getattr (see
+            # err.status may not exist (see
             # https://github.com/python-microscope/vendor-issues/issues/2)
-            if getattr(err, "status", None) == _XI_TIMEOUT:
+            try:
+                status = err.status
+            except AttributeError:
+                status = None
+            if status == _XI_TIMEOUT:
                 return None
-            elif (
-                getattr(err, "status", None) == _XI_ACQUISITION_STOPED
-                and not self._acquiring
-            ):
+            elif status == _XI_ACQUISITION_STOPED and not self._acquiring:
                 # We can end up here during disable if self._acquiring
                 # was True but is now False.
                 return None
             else:
                 raise
 
+        # The image buffer is reused by XiAPI on the next get_image
+        # but data is only dispatched later so we need our own copy,
+        # which get_image_data_numpy already makes.
         data: np.ndarray = self._img.get_image_data_numpy()
-        _logger.info(
-            "Fetched imaged with dims %s and size %s.", data.shape, data.size
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Fetched image with dims %s and size %s.",
+                data.shape,
+                data.size,
+            )
         return data
 
     def abort(self):
@@ -216,6 +272,29 @@ class XimeaCamera(microscope.abc.Camera):
             )
             self._handle.open_device_by_SN(self._serial_number)
 
+        # Bind the methods used on each frame and trigger once.
+        self._get_image = self._handle.get_image
+        self._trigger_sw = self._handle.set_trigger_software
+
+        # With the unsafe buffer policy, get_image points _img to the
+        # XiAPI buffer instead of copying into a buffer we own.  This
+        # is the XiAPI default but set it explicitly since we copy the
+        # image data ourselves in _fetch_data.
+        self._handle.set_buffer_policy("XI_BP_UNSAFE")
+
+        if self._buffers_queue_size is not None:
+            # Must be set before acquisition starts.
+            self._handle.set_buffers_queue_size(self._buffers_queue_size)
+
+        # The increments are fixed for the sensor so read them once
+        # instead of on each ROI change.
+        self._roi_incr = (
+            self._handle.get_height_increment(),
+            self._handle.get_width_increment(),
+            self._handle.get_offsetX_increment(),
+            self._handle.get_offsetY_increment(),
+        )
+
         self._sensor_shape = (
             self._handle.get_width_maximum()
             + self._handle.get_offsetX_maximum(),
@@ -228,37 +307,46 @@ class XimeaCamera(microscope.abc.Camera):
             width=self._sensor_shape[0],
             height=self._sensor_shape[1],
         )
-        self.set_roi(self._roi)
+        self._write_roi(self._roi)
 
         self.set_trigger(
             microscope.TriggerType.SOFTWARE, microscope.TriggerMode.ONCE
         )
 
         # Add settings for the different temperature sensors.
-        for temp_param_name in [
-            "chip_temp",
-            "hous_temp",
-            "hous_back_side_temp",
-            "sensor_board_temp",
-        ]:
-            get_temp_method = getattr(self._handle, "get_" + temp_param_name)
-            # Not all cameras have temperature sensors in all
-            # locations.  We can't query if the sensor is there, we
-            # can only try to read the temperature and skip that
-            # temperature sensor if we get an exception.
-            try:
-                get_temp_method()
-            except xiapi.Xi_error as err:
-                if err.status != _XI_NOT_SUPPORTED and err.status != _XI_NOT_IMPLEMENTED:
-                    raise
-            else:
-                self.add_setting(
-                    temp_param_name,
-                    "float",
-                    get_temp_method,
-                    None,
-                    values=tuple(),
-                )
+        model = self._handle.get_device_name()
+        temp_param_names = _TEMP_SENSORS_BY_MODEL.get(model)
+        if temp_param_names is None:
+            temp_param_names = tuple(
+                name
+                for name in _TEMP_PARAM_NAMES
+                if self._has_temp_sensor(name)
+            )
+            _TEMP_SENSORS_BY_MODEL[model] = temp_param_names
+        for temp_param_name in temp_param_names:
+            self.add_setting(
+                temp_param_name,
+                "float",
+                getattr(self._handle, "get_" + temp_param_name),
+                None,
+                values=tuple(),
+            )
+
+    def _has_temp_sensor(self, temp_param_name: str) -> bool:
+        # Not all cameras have temperature sensors in all locations.
+        # We can't query if the sensor is there, we can only try to
+        # read the temperature and skip that temperature sensor if we
+        # get an exception.
+        try:
+            getattr(self._handle, "get_" + temp_param_name)()
+        except xiapi.Xi_error as err:
+            if (
+                err.status != _XI_NOT_SUPPORTED
+                and err.status != _XI_NOT_IMPLEMENTED
+            ):
+                raise
+            return False
+        return True
 
     def _do_disable(self):
         self.abort()
@@ -296,8 +384,8 @@ class XimeaCamera(microscope.abc.Camera):
     def _do_trigger(self) -> None:
         # Value for set_trigger_software() has no meaning.  See
         # https://github.com/python-microscope/vendor-issues/issues/3
-        if self._trigger_map == TRIGGER_TABLE[(microscope.TriggerType.SOFTWARE, microscope.TriggerMode.ONCE)]:
-            self._handle.set_trigger_software(1)
+        if self._is_sw_once:
+            self._trigger_sw(1)
 
     def _get_binning(self) -> microscope.Binning:
         return self._binning
@@ -312,12 +400,13 @@ class XimeaCamera(microscope.abc.Camera):
         raise NotImplementedError()
 
     def _get_roi(self) -> microscope.ROI:
-        assert self._roi == microscope.ROI(
-            self._handle.get_offsetX(),
-            self._handle.get_offsetY(),
-            self._handle.get_width(),
-            self._handle.get_height(),
-        ), "ROI attribute is out of sync with internal camera setting"
+        if self._verify_roi:
+            assert self._roi == microscope.ROI(
+                self._handle.get_offsetX(),
+                self._handle.get_offsetY(),
+                self._handle.get_width(),
+                self._handle.get_height(),
+            ), "ROI attribute is out of sync with internal camera setting"
         return self._roi
 
     def _set_roi(self, roi: microscope.ROI) -> bool:
@@ -329,66 +418,52 @@ class XimeaCamera(microscope.abc.Camera):
                 "ROI %s does not fit in sensor shape %s"
                 % (roi, self._sensor_shape)
             )
+        # XiAPI fails with invalid arguments if the ROI is not a
+        # multiple of the increments so snap it before setting it.
+        # The size is at least one increment.
+        h_incr, w_incr, x_incr, y_incr = self._roi_incr
+        roi = microscope.ROI(
+            left=(roi.left // x_incr) * x_incr,
+            top=(roi.top // y_incr) * y_incr,
+            width=max(w_incr, (roi.width // w_incr) * w_incr),
+            height=max(h_incr, (roi.height // h_incr) * h_incr),
+        )
+        if roi == self._roi:
+            return True
         try:
-            # These methods will fail if the width/height plus their
-            # corresponding offsets are higher than the sensor size.
-            # So we start by setting the offset to zero.  Cases to
-            # think off: 1) shrinking ROI size, 2) increasing ROI
-            # size, 3) resetting ROI and so can't trust self._roi as
-            # the current state (see this exception handling).
-            with _disabled_camera(self):
-                self._handle.set_offsetX(0)
-                self._handle.set_offsetY(0)
-                self._handle.set_width(roi.width)
-                self._handle.set_height(roi.height)
-                self._handle.set_offsetX(roi.left)
-                self._handle.set_offsetY(roi.top)
-        except xiapi.Xi_error as err:
-            if err.status == _XI_INVALID_ARGUMENTS:
-                with _disabled_camera(self):
-                    # we don't need to set again
-                    # the offsets to 0 as the exception
-                    # is thrown only starting from
-                    # set_width
-                    height = roi.height
-                    width = roi.width
-                    left = roi.left
-                    top = roi.top
-
-                    # TODO: maybe these if conditions
-                    # make the code less readable...
-                    if height != self._roi.height:
-                        h_incr = self._handle.get_height_increment()
-                        height = (round(height / h_incr) *
-                                  h_incr if (height % h_incr) != 0 else height)
-                        self._handle.set_height(height)
-
-                    if width != self._roi.width:
-                        w_incr = self._handle.get_width_increment()
-                        width = (round(width / w_incr) *
-                                 w_incr if (width % w_incr) != 0 else width)
-                        self._handle.set_width(width)
-
-                    if left != self._roi.left:
-                        l_incr = self._handle.get_offsetX_increment()
-                        left = (round(left / l_incr)*l_incr if (left %
-                                l_incr) != 0 else left)
-                        self._handle.set_offsetX(left)
-
-                    if top != self._roi.top:
-                        t_incr = self._handle.get_offsetY_increment()
-                        top = (round(top / t_incr)*t_incr if (top %
-                               t_incr) != 0 else top)
-                        self._handle.set_offsetY(top)
-                    # we change input parameter roi so that
-                    # the internal self._roi is updated as well
-                    roi = microscope.ROI(left, top, width, height)
+            if (roi.width, roi.height) == (self._roi.width, self._roi.height):
+                # Only the offsets changed.  Some cameras allow
+                # changing them during acquisition so try that first
+                # and only stop acquisition if it fails.
+                try:
+                    self._handle.set_offsetX(roi.left)
+                    self._handle.set_offsetY(roi.top)
+                except xiapi.Xi_error:
+                    self._write_roi(roi)
+            else:
+                self._write_roi(roi)
         except Exception:
-            self._set_roi(self._roi)  # set it back to whatever was before
+            self._write_roi(self._roi)  # set it back to whatever was before
             raise
         self._roi = roi
         return True
 
+    def _write_roi(self, roi: microscope.ROI) -> None:
+        """Set all ROI parameters on the camera, stopping acquisition."""
+        # These methods will fail if the width/height plus their
+        # corresponding offsets are higher than the sensor size.  So
+        # we start by setting the offset to zero.  Cases to think off:
+        # 1) shrinking ROI size, 2) increasing ROI size, 3) resetting
+        # ROI and so can't trust the current camera state (see the
+        # exception handling in `_set_roi`).
+        with _DisabledCamera(self):
+            self._handle.set_offsetX(0)
+            self._handle.set_offsetY(0)
+            self._handle.set_width(roi.width)
+            self._handle.set_height(roi.height)
+            self._handle.set_offsetX(roi.left)
+            self._handle.set_offsetY(roi.top)
+
     def _do_shutdown(self) -> None:
         if self._acquiring:
             self._handle.stop_acquisition()
@@ -417,8 +492,9 @@ class XimeaCamera(microscope.abc.Camera):
                 f"TriggerType.{ttype.name} - TriggerMode.{tmode.name} not supported"
             )
 
-        if new_map != self._trigger_map:
-            with _disabled_camera(self):
+        if new_map is not self._trigger_map:
+            with _DisabledCamera(self):
                 self._handle.set_trigger_source(new_map[0])
                 self._handle.set_trigger_selector(new_map[1])
             self._trigger_map = new_map
+            self._is_sw_once = new_map is _SW_ONCE_MAP
@@ -56,12 +56,18 @@ class CoboltLaser(
         )
         # Start a logger.
         response = self.send(b"sn?")
-        _logger.info("Cobolt laser serial number: [%s]", response.decode())
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info(
+                "Cobolt laser serial number: [%s]", response.decode()
+            )
         # We need to ensure that autostart is disabled so that we can switch emission
         # on/off remotely.
         response = self.send(b"@cobas 0")
-        _logger.info("Response to @cobas 0 [%s]", response.decode())
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info("Response to @cobas 0 [%s]", response.decode())
 
+        # The maximum power does not change for the laser head so
+        # read it once instead of on each power get/set.
         self._max_power_mw = float(self.send(b"gmlp?"))
 
         self.initialize()
@@ -79,6 +85,16 @@ class CoboltLaser(
                 success = True
         return response
 
+    def _drain_responses(self) -> None:
+        """Read and discard responses until a read times out.
+
+        Unlike `reset_input_buffer`, this also discards responses that
+        are still on their way.
+
+        """
+        while self._readline():
+            pass
+
     @microscope.abc.SerialDeviceMixin.lock_comms
     def clearFault(self):
         self.send(b"cf")
@@ -86,29 +102,44 @@ class CoboltLaser(
 
     @microscope.abc.SerialDeviceMixin.lock_comms
     def get_status(self):
-        result = []
-        for cmd, stat in [
+        commands, stats = zip(
             (b"l?", "Emission on?"),
             (b"p?", "Target power:"),
             (b"pa?", "Measured power:"),
             (b"f?", "Fault?"),
             (b"hrs?", "Head operating hours:"),
-        ]:
-            response = self.send(cmd)
-            result.append(stat + " " + response.decode())
-        return result
+        )
+        # Send all queries in a single write and then read all the
+        # responses, instead of waiting for each response in turn.
+        self._write(b"\r\n".join(commands))
+        responses = []
+        for command in commands:
+            response = self._readline()
+            if not response:
+                # A response timed out.  It and the responses after
+                # it may still arrive and be read as the response of
+                # another query, so discard them and query them one at
+                # a time.
+                self._drain_responses()
+                responses = [self.send(cmd) for cmd in commands]
+                break
+            responses.append(response)
+        return [
+            stat + " " + response.decode()
+            for stat, response in zip(stats, responses)
+        ]
 
     @microscope.abc.SerialDeviceMixin.lock_comms
     def _do_shutdown(self) -> None:
         # Disable laser.
         self.disable()
         self.send(b"@cob0")
-        self.connection.flushInput()
+        self.connection.reset_input_buffer()
 
     #  Initialization to do when cockpit connects.
     @microscope.abc.SerialDeviceMixin.lock_comms
     def initialize(self):
-        self.connection.flushInput()
+        self.connection.reset_input_buffer()
         # We don't want 'direct control' mode.
         self.send(b"@cobasdr 0")
         # Force laser into autostart mode.
@@ -120,7 +151,8 @@ class CoboltLaser(
         _logger.info("Turning laser ON.")
         # Turn on emission.
         response = self.send(b"l1")
-        _logger.info("l1: [%s]", response.decode())
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info("l1: [%s]", response.decode())
 
         if not self.get_is_on():
             # Something went wrong.
@@ -143,14 +175,22 @@ class CoboltLaser(
 
     @microscope.abc.SerialDeviceMixin.lock_comms
     def _get_power_mw(self) -> float:
-        if not self.get_is_on():
+        # Query emission state and power in a single write.
+        self._write(b"l?\r\npa?")
+        state = self._readline()
+        response = self._readline()
+        if not state:
+            # The l? response timed out.  It and the pa? response may
+            # still arrive and be read as the response of another
+            # query, so discard them and query both again.
+            self._drain_responses()
+            state = self.send(b"l?")
+            response = b""
+        if state != b"1":
             return 0.0
-        success = False
         # Sometimes the controller returns b'1' rather than the power.
-        while not success:
+        while response == b"1" or not response:
             response = self.send(b"pa?")
-            if response != b"1":
-                success = True
         return 1000 * float(response)
 
     @microscope.abc.SerialDeviceMixin.lock_comms
@@ -29,9 +29,12 @@ device classes instead.  There's a concrete class for each device
 interface.
 """
 
+import ctypes
 import enum
 import io
+import types
 
+import numpy
 import serial.serialutil
 
 
@@ -720,3 +723,251 @@ class OmicronDeepstarLaserMock(SerialMock):
             )
 
         self.in_buffer.write(answer + self.eol)
+
+
+class XimeaErrorMock(Exception):
+    """Modelled after `ximea.xiapi.Xi_error`."""
+
+    def __init__(self, status):
+        super().__init__("ERROR %d" % status)
+        self.status = status
+
+
+class XimeaImageMock:
+    """Modelled after `ximea.xiapi.Image`, the XI_IMG structure."""
+
+    def __init__(self):
+        self.bp = None
+        self.frm = 0
+        self.width = 0
+        self.height = 0
+        self.padding_x = 0
+        # The buffer pointed by bp, with the row padding.
+        self._buffer = None
+
+    def get_image_data_numpy(self):
+        # Like XiAPI, returns a copy without the row padding.
+        return self._buffer[:, : self.width].copy()
+
+
+class XimeaCameraMock:
+    """Modelled after `ximea.xiapi.Camera` with a 16 bit MQ camera.
+
+    Only what `XimeaCamera` uses is mocked.  One image is acquired
+    for each software trigger.  Images have padding at the end of
+    each row, like the actual XiAPI buffers may have.
+
+    """
+
+    # Sensor width and height in pixels.
+    sensor_shape = (64, 48)
+    roi_increment = 4
+    # Padding at the end of each row in pixels.
+    row_padding = 2
+    # Whether ROI offsets can be changed during acquisition.
+    offsets_during_acquisition = True
+
+    def __init__(self):
+        self.CAM_OPEN = False
+        self.acquiring = False
+        self.params = {
+            "offsetX": 0,
+            "offsetY": 0,
+            "width": self.sensor_shape[0],
+            "height": self.sensor_shape[1],
+            "trigger_source": "XI_TRG_OFF",
+            "trigger_selector": "XI_TRG_SEL_FRAME_START",
+        }
+        # Number of images acquired but not yet read.
+        self.queued_images = 0
+        self.n_images = 0
+        # None if never set.
+        self.buffers_queue_size = None
+        # Keep a reference to the last buffer so that Image.bp is
+        # valid until the next get_image.
+        self._buffer = None
+
+    def set_debug_level(self, level):
+        pass
+
+    def get_number_devices(self):
+        return 1
+
+    def open_device(self):
+        self.CAM_OPEN = True
+
+    def open_device_by_SN(self, serial_number):
+        self.CAM_OPEN = True
+
+    def close_device(self):
+        self.CAM_OPEN = False
+
+    def get_device_name(self):
+        return "MQ013MG-E2"
+
+    def get_imgdataformat(self):
+        return "XI_MONO16"
+
+    def set_buffer_policy(self, policy):
+        pass
+
+    def set_buffers_queue_size(self, size):
+        # Can only be changed while not acquiring.
+        if self.acquiring:
+            raise XimeaErrorMock(12)  # XI_NOT_SUPPORTED
+        self.buffers_queue_size = size
+
+    def set_param(self, name, value):
+        if (
+            name in ("offsetX", "offsetY")
+            and self.acquiring
+            and not self.offsets_during_acquisition
+        ):
+            raise XimeaErrorMock(12)  # XI_NOT_SUPPORTED
+        if name in ("offsetX", "width"):
+            other = "width" if name == "offsetX" else "offsetX"
+            limit = self.sensor_shape[0]
+        elif name in ("offsetY", "height"):
+            other = "height" if name == "offsetY" else "offsetY"
+            limit = self.sensor_shape[1]
+        else:
+            other = None
+        if other is not None and (
+            value % self.roi_increment != 0
+            or value + self.params[other] > limit
+            or (name in ("width", "height") and value < self.roi_increment)
+        ):
+            raise XimeaErrorMock(11)  # XI_INVALID_ARG
+        self.params[name] = value
+
+    def get_param(self, name):
+        return self.params[name]
+
+    def set_offsetX(self, value):
+        self.set_param("offsetX", value)
+
+    def set_offsetY(self, value):
+        self.set_param("offsetY", value)
+
+    def set_width(self, value):
+        self.set_param("width", value)
+
+    def set_height(self, value):
+        self.set_param("height", value)
+
+    def set_trigger_source(self, value):
+        self.set_param("trigger_source", value)
+
+    def set_trigger_selector(self, value):
+        self.set_param("trigger_selector", value)
+
+    def get_offsetX(self):
+        return self.params["offsetX"]
+
+    def get_offsetY(self):
+        return self.params["offsetY"]
+
+    def get_width(self):
+        return self.params["width"]
+
+    def get_height(self):
+        return self.params["height"]
+
+    def get_width_maximum(self):
+        return self.sensor_shape[0] - self.params["offsetX"]
+
+    def get_height_maximum(self):
+        return self.sensor_shape[1] - self.params["offsetY"]
+
+    def get_offsetX_maximum(self):
+        return self.sensor_shape[0] - self.params["width"]
+
+    def get_offsetY_maximum(self):
+        return self.sensor_shape[1] - self.params["height"]
+
+    def get_width_increment(self):
+        return self.roi_increment
+
+    def get_height_increment(self):
+        return self.roi_increment
+
+    def get_offsetX_increment(self):
+        return self.roi_increment
+
+    def get_offsetY_increment(self):
+        return self.roi_increment
+
+    def get_chip_temp(self):
+        return 35.0
+
+    def get_hous_temp(self):
+        raise XimeaErrorMock(12)  # XI_NOT_SUPPORTED
+
+    def get_hous_back_side_temp(self):
+        raise XimeaErrorMock(12)  # XI_NOT_SUPPORTED
+
+    def get_sensor_board_temp(self):
+        raise XimeaErrorMock(12)  # XI_NOT_SUPPORTED
+
+    def start_acquisition(self):
+        self.acquiring = True
+
+    def stop_acquisition(self):
+        self.acquiring = False
+        self.queued_images = 0
+
+    def set_trigger_software(self, value):
+        if self.acquiring:
+            self.queued_images += 1
+
+    def get_image(self, image, timeout=5000):
+        if not self.acquiring:
+            raise XimeaErrorMock(45)  # XI_ACQUISITION_STOPED
+        if self.queued_images == 0:
+            raise XimeaErrorMock(10)  # XI_TIMEOUT
+        self.queued_images -= 1
+        self.n_images += 1
+        width = self.params["width"]
+        height = self.params["height"]
+        # Fill the padding with a different value so that reading it
+        # as part of the image shows up.
+        self._buffer = numpy.full(
+            (height, width + self.row_padding), 0xFFFF, dtype=numpy.uint16
+        )
+        self._buffer[:, :width] = self.n_images
+        image._buffer = self._buffer
+        image.bp = self._buffer.ctypes.data
+        image.frm = XIMEA_IMG_FORMAT["XI_MONO16"].value
+        image.width = width
+        image.height = height
+        image.padding_x = self.row_padding * self._buffer.itemsize
+
+
+XIMEA_IMG_FORMAT = {
+    "XI_MONO8": ctypes.c_uint(0),
+    "XI_MONO16": ctypes.c_uint(1),
+    "XI_RGB24": ctypes.c_uint(2),
+    "XI_RGB32": ctypes.c_uint(3),
+    "XI_RGB_PLANAR": ctypes.c_uint(4),
+    "XI_RAW8": ctypes.c_uint(5),
+    "XI_RAW16": ctypes.c_uint(6),
+}
+
+
+def ximea_modules():
+    """Mock modules of the ximea package to patch into `sys.modules`.
+
+    Like xiApiPython, the values of `xidefs.XI_IMG_FORMAT` are
+    `ctypes.c_uint` instances.
+
+    """
+    xidefs = types.ModuleType("ximea.xidefs")
+    xidefs.XI_IMG_FORMAT = XIMEA_IMG_FORMAT
+    xiapi = types.ModuleType("ximea.xiapi")
+    xiapi.Camera = XimeaCameraMock
+    xiapi.Image = XimeaImageMock
+    xiapi.Xi_error = XimeaErrorMock
+    ximea = types.ModuleType("ximea")
+    ximea.xidefs = xidefs
+    ximea.xiapi = xiapi
+    return {"ximea": ximea, "ximea.xidefs": xidefs, "ximea.xiapi": xiapi}
@@ -35,11 +35,15 @@ constructs the device instance required to run the tests.
 
 """
 
+import importlib
+import queue
+import sys
 import unittest
 import unittest.mock
 
 import numpy
 
+import microscope
 import microscope.testsuite.devices as dummies
 import microscope.testsuite.mock_devices as mocks
 from microscope import simulators
@@ -380,6 +384,49 @@ class TestCoboltLaser(unittest.TestCase, LightSourceTests, SerialDeviceTests):
 
         self.fake = CoboltLaserMock
 
+    def test_status_in_single_write(self):
+        self.device.enable()
+        with unittest.mock.patch.object(
+            self.device.connection, "write", wraps=self.device.connection.write
+        ) as write:
+            status = self.device.get_status()
+        write.assert_called_once()
+        self.assertEqual(status[0], "Emission on? 1")
+        self.assertEqual(status[3], "Fault? 0")
+
+    def test_status_with_timed_out_response(self):
+        # The second response times out in the single write and the
+        # responses after it arrive late.  They are discarded and all
+        # are queried again one at a time.
+        late_responses = [b"0.0500", b"0.0490", b"0", b"8", b""]
+        requeried = [b"1", b"0.0500", b"0.0490", b"0", b"8"]
+        with unittest.mock.patch.object(
+            self.device,
+            "_readline",
+            side_effect=[b"1", b""] + late_responses + requeried,
+        ):
+            status = self.device.get_status()
+        self.assertEqual(
+            status,
+            [
+                "Emission on? 1",
+                "Target power: 0.0500",
+                "Measured power: 0.0490",
+                "Fault? 0",
+                "Head operating hours: 8",
+            ],
+        )
+
+    def test_power_with_timed_out_emission_response(self):
+        # The l? response times out and arrives late, followed by the
+        # pa? response.  Both are discarded and queried again.
+        with unittest.mock.patch.object(
+            self.device,
+            "_readline",
+            side_effect=[b"", b"1", b"0.0490", b"", b"1", b"0.0500"],
+        ):
+            self.assertEqual(self.device._get_power_mw(), 50.0)
+
 
 class TestOmicronDeepstarLaser(
     unittest.TestCase, LightSourceTests, SerialDeviceTests
@@ -421,6 +468,107 @@ class TestDummyCamera(unittest.TestCase, CameraTests):
         self.device = simulators.SimulatedCamera()
 
 
+class TestXimeaImport(unittest.TestCase):
+    def test_import(self):
+        with unittest.mock.patch.dict(sys.modules, mocks.ximea_modules()):
+            sys.modules.pop("microscope.cameras.ximea", None)
+            ximea = importlib.import_module("microscope.cameras.ximea")
+        self.assertTrue(issubclass(ximea.XimeaCamera, microscope.abc.Camera))
+
+
+class TestXimeaCamera(unittest.TestCase, CameraTests):
+    def setUp(self):
+        patcher = unittest.mock.patch.dict(sys.modules, mocks.ximea_modules())
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        sys.modules.pop("microscope.cameras.ximea", None)
+        self.ximea = importlib.import_module("microscope.cameras.ximea")
+
+        self.device = self.ximea.XimeaCamera()
+        self.addCleanup(self.device.shutdown)
+        self.fake = self.device._handle
+        self.images = queue.Queue()
+        self.device.set_client(self.images)
+
+    def get_image(self):
+        self.device._do_trigger()
+        return self.images.get(timeout=5)
+
+    def test_buffers_queue_size(self):
+        self.assertIsNone(self.fake.buffers_queue_size)
+        device = self.ximea.XimeaCamera(buffers_queue_size=7)
+        self.addCleanup(device.shutdown)
+        self.assertEqual(device._handle.buffers_queue_size, 7)
+        # The mock only accepts it before acquisition starts, so it
+        # must still be set after enabling.
+        device.enable()
+        self.assertTrue(device._handle.acquiring)
+        self.assertEqual(device._handle.buffers_queue_size, 7)
+
+    def test_fetch_image(self):
+        self.device.enable()
+        image = self.get_image()
+        self.assertEqual(image.shape, (48, 64))
+        self.assertEqual(image.dtype, numpy.uint16)
+        # Padding at the end of the rows is not part of the image.
+        self.assertTrue(numpy.all(image == 1))
+
+    def test_images_are_copies(self):
+        self.device.enable()
+        first = self.get_image()
+        self.get_image()
+        self.assertTrue(numpy.all(first == 1))
+
+    def test_queued_images_fetched_in_order(self):
+        self.device.enable()
+        for _ in range(3):
+            self.device._do_trigger()
+        for i in range(1, 4):
+            self.assertTrue(numpy.all(self.images.get(timeout=5) == i))
+        self.assertEqual(self.fake.queued_images, 0)
+
+    def test_roi_change_while_enabled(self):
+        self.device.enable()
+        self.device.set_roi(microscope.ROI(8, 4, 32, 24))
+        self.assertTrue(self.device.enabled)
+        image = self.get_image()
+        self.assertEqual(image.shape, (24, 32))
+        self.assertTrue(numpy.all(image == 1))
+
+    def test_offset_change_keeps_acquiring(self):
+        self.device.set_roi(microscope.ROI(0, 0, 32, 24))
+        self.device.enable()
+        with unittest.mock.patch.object(
+            self.fake, "stop_acquisition", wraps=self.fake.stop_acquisition
+        ) as stop_acquisition:
+            self.device.set_roi(microscope.ROI(8, 4, 32, 24))
+        stop_acquisition.assert_not_called()
+        self.assertEqual(self.fake.get_offsetX(), 8)
+        self.assertEqual(self.fake.get_offsetY(), 4)
+
+    def test_offset_change_rejected_during_acquisition(self):
+        self.fake.offsets_during_acquisition = False
+        self.device.set_roi(microscope.ROI(0, 0, 32, 24))
+        self.device.enable()
+        with unittest.mock.patch.object(
+            self.fake, "stop_acquisition", wraps=self.fake.stop_acquisition
+        ) as stop_acquisition:
+            self.device.set_roi(microscope.ROI(8, 4, 32, 24))
+        stop_acquisition.assert_called_once()
+        self.assertTrue(self.device.enabled)
+        self.assertEqual(self.device.get_roi(), microscope.ROI(8, 4, 32, 24))
+        self.assertEqual(self.fake.get_offsetX(), 8)
+        self.assertEqual(self.fake.get_offsetY(), 4)
+
+    def test_roi_snapped_to_increments(self):
+        self.device.set_roi(microscope.ROI(1, 6, 33, 30))
+        self.assertEqual(self.device.get_roi(), microscope.ROI(0, 4, 32, 28))
+
+    def test_roi_smaller_than_increment(self):
+        self.device.set_roi(microscope.ROI(0, 0, 3, 48))
+        self.assertEqual(self.device.get_roi(), microscope.ROI(0, 0, 4, 48))
+
+
 class TestImageGenerator(unittest.TestCase):
     def test_non_square_patterns_shape(self):
         # TODO: we should also be testing this via the camera but the